@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import copy
+import os
+import threading
+import pindef
+
+def counting_parse():
+    calls = []
+    parse_pins = pindef.parse_pins
+
+    def parse(*args, **kwargs):
+        calls.append(args[0])
+        return parse_pins(*args, **kwargs)
+
+    pindef.parse_pins = parse
+    return calls, parse_pins
+
+def check_counters():
+    registry = pindef.ChipRegistry(maxsize=2)
+
+    registry.get_chip("cv1800b")
+    registry.get_chip("cv1800b")
+    registry.get_chip("sg2002")
+    registry.get_chip("cv1812h")
+
+    stats = registry.stats()
+    assert stats == {"hits": 1, "misses": 3, "evictions": 1, "size": 2}, stats
+
+    # cv1800b was the least recently used chip and got evicted
+    registry.get_chip("cv1800b")
+    assert registry.stats()["misses"] == 4
+
+def check_alias():
+    registry = pindef.ChipRegistry()
+
+    assert registry.get_chip("cv1812h") is registry.get_chip("sg2000")
+    assert registry.stats()["size"] == 1
+
+def check_invalid():
+    registry = pindef.ChipRegistry()
+
+    for name in ["nope", "../pinout/sg2000", "/tmp/sg2000"]:
+        try:
+            registry.get_chip(name)
+        except KeyError:
+            pass
+        else:
+            raise AssertionError(name)
+
+    assert registry._loading == {}
+
+def check_failed_load():
+    registry = pindef.ChipRegistry(path="/nonexistent")
+
+    try:
+        registry.get_chip("sg2002")
+    except FileNotFoundError:
+        pass
+    else:
+        raise AssertionError("sg2002")
+
+    assert registry._loading == {}
+
+def check_concurrent():
+    registry = pindef.ChipRegistry()
+    calls, parse_pins = counting_parse()
+    barrier = threading.Barrier(8)
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(registry.get_chip("sg2000"))
+
+    try:
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        pindef.parse_pins = parse_pins
+
+    stats = registry.stats()
+    assert len(calls) == 1, calls
+    assert all(pins is results[0] for pins in results)
+    assert stats["hits"] + stats["misses"] == 8, stats
+    assert registry._loading == {}
+
+def check_shared_pins():
+    registry = pindef.ChipRegistry()
+    pins = registry.get_chip("sg2002")
+
+    assert copy.deepcopy(pins) == pindef.parse_pins(os.path.join(registry.path, "sg2002_pindef.csv"))
+
+if __name__ == "__main__":
+    check_counters()
+    check_alias()
+    check_invalid()
+    check_failed_load()
+    check_concurrent()
+    check_shared_pins()
+    print("ok")
@@ -5,6 +5,7 @@ import sys
 import pindef
 import datetime
 import math
+from region import get_chip_regions
 
 def print_header(fp):
     year = datetime.datetime.now().date().strftime("%Y")
@@ -57,7 +58,8 @@ def print_pins(fp, pins: dict):
 
 if __name__ == "__main__":
     chipname = sys.argv[1]
-    pins = pindef.parse_pins(chipname + "_pindef.csv")
+    table = pindef.region_table(get_chip_regions(chipname))
+    pins = pindef.parse_pins(chipname + "_pindef.csv", table)
 
     with open("pinctrl-" + chipname + ".h", "w", encoding="utf-8") as fp:
         print_header(fp)
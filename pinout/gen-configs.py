@@ -5,8 +5,13 @@ import sys
 import pindef
 import datetime
 import math
+import hashlib
 from pindef import PIN_IO_TYPE
-from vddio import CV18XX_VDDIO_MAP
+from vddio import get_chip_vddio
+from region import get_chip_regions
+
+SHARED_VDDIO_NAME = "cv18xx-vddio"
+SHARED_VDDIO_PREFIX = "cv18xx"
 
 def print_pins(fp, chipname: str, pins: dict):
     fp.write("static const struct pinctrl_pin_desc %s_pins[] = {\n" % chipname)
@@ -24,24 +29,19 @@ def print_pins(fp, chipname: str, pins: dict):
 
     fp.write("};\n")
 
-def cook_pin_area(area: str):
-    if area == "SYS":
-        return "CV1800_PINCONF_AREA_SYS"
-    elif area == "RTC":
-        return "CV1800_PINCONF_AREA_RTC"
-    else:
-        return ""
+def cook_pin_area(area: str, table: dict):
+    return pindef.pin_area_enum(area, table)
 
-def cook_func_pindata(pin: dict):
+def cook_func_pindata(pin: dict, table: dict):
     lines = [
         "CV1800_FUNC_PIN({}, {},".format("PIN_" + pin["name"], pin["power_domain"]),
         "\t\t{},".format(str(pin["type"])),
-        "\t\t{}, 0x{:03x}, {}),".format(cook_pin_area(pin["mux"]["area"]), pin["mux"]["offset"], pin["mux"]["max"]),
+        "\t\t{}, 0x{:03x}, {}),".format(cook_pin_area(pin["mux"]["area"], table), pin["mux"]["offset"], pin["mux"]["max"]),
     ]
 
     return "\t" +"\n\t".join(lines) + "\n"
 
-def cook_generate_pindata(pin: dict):
+def cook_generate_pindata(pin: dict, table: dict):
     if not "iocfg" in pin:
         print(pin["name"])
 
@@ -49,37 +49,37 @@ def cook_generate_pindata(pin: dict):
         lines = [
             "CV1800_GENERATE_PIN_MUX2({}, {},".format("PIN_" + pin["name"], pin["power_domain"]),
             "\t\t\t {},".format(str(pin["type"])),
-            "\t\t\t {}, 0x{:03x}, {},".format(cook_pin_area(pin["mux"]["area"]), pin["mux"]["offset"], pin["mux"]["max"]),
-            "\t\t\t {}, 0x{:03x}, {},".format(cook_pin_area(pin["mux"]['sub']["area"]), pin["mux"]['sub']["offset"], pin["mux"]['sub']["max"]),
-            "\t\t\t {}, 0x{:03x}),".format(cook_pin_area(pin["iocfg"]["area"]), pin["iocfg"]["offset"]),
+            "\t\t\t {}, 0x{:03x}, {},".format(cook_pin_area(pin["mux"]["area"], table), pin["mux"]["offset"], pin["mux"]["max"]),
+            "\t\t\t {}, 0x{:03x}, {},".format(cook_pin_area(pin["mux"]['sub']["area"], table), pin["mux"]['sub']["offset"], pin["mux"]['sub']["max"]),
+            "\t\t\t {}, 0x{:03x}),".format(cook_pin_area(pin["iocfg"]["area"], table), pin["iocfg"]["offset"]),
         ]
     else:
         lines = [
             "CV1800_GENERAL_PIN({}, {},".format("PIN_" + pin["name"], pin["power_domain"]),
             "\t\t   {},".format(str(pin["type"])),
-            "\t\t   {}, 0x{:03x}, {},".format(cook_pin_area(pin["mux"]["area"]), pin["mux"]["offset"], pin["mux"]["max"]),
-            "\t\t   {}, 0x{:03x}),".format(cook_pin_area(pin["iocfg"]["area"]), pin["iocfg"]["offset"]),
+            "\t\t   {}, 0x{:03x}, {},".format(cook_pin_area(pin["mux"]["area"], table), pin["mux"]["offset"], pin["mux"]["max"]),
+            "\t\t   {}, 0x{:03x}),".format(cook_pin_area(pin["iocfg"]["area"], table), pin["iocfg"]["offset"]),
         ]
 
     return "\t" +"\n\t".join(lines) + "\n"
 
 
-def print_pindata(fp, chipname: str, pins: dict):
+def print_pindata(fp, chipname: str, pins: dict, table: dict):
     fp.write("static const struct cv1800_pin %s_pin_data[ARRAY_SIZE(%s_pins)] = {\n" % (chipname, chipname))
 
     for id, pin in pins.items():
         ptype = pin["type"]
 
         if ptype is PIN_IO_TYPE.IO_TYPE_AUDIO or ptype is PIN_IO_TYPE.IO_TYPE_ETH:
-            fp.write(cook_func_pindata(pin))
+            fp.write(cook_func_pindata(pin, table))
         elif ptype is PIN_IO_TYPE.IO_TYPE_1V8_OR_3V3 or ptype is PIN_IO_TYPE.IO_TYPE_1V8_ONLY:
-            fp.write(cook_generate_pindata(pin))
+            fp.write(cook_generate_pindata(pin, table))
         else:
             raise KeyError(ptype)
 
     fp.write("};\n")
 
-def print_misc_top(fp, chipname: str):
+def print_misc_top(fp, chipname: str, shared: bool = False):
     year = datetime.datetime.now().date().strftime("%Y")
 
     value = """// SPDX-License-Identifier: GPL-2.0
@@ -103,6 +103,9 @@ def print_misc_top(fp, chipname: str):
 #include \"pinctrl-cv18xx.h\"
 """.format(chipname, chipname.upper(), year)
 
+    if shared:
+        value += "#include \"pinctrl-{}.h\"\n".format(SHARED_VDDIO_NAME)
+
     fp.write(value)
 
 def print_misc_down(fp, chipname: str):
@@ -141,7 +144,7 @@ MODULE_LICENSE("GPL");
 def pin_to_power_domains(pins: dict):
     return sorted(set([pin["power_domain"] for pin in pins.values()]))
 
-def print_power_domain_mapping(fp, chipname: str, pin: dict):
+def print_power_domain_mapping(fp, chipname: str, pins: dict):
     mapping = pin_to_power_domains(pins)
     maxlength = max([len(domain) for domain in mapping]) + 8
     if maxlength < 32:
@@ -171,13 +174,20 @@ def print_power_domain_mapping(fp, chipname: str, pin: dict):
     fp.write("};\n")
 
 
-def print_vddio(fp, chipname):
+def cook_vddio_items(vddio_map: list[dict]):
     def get_vddio_map(type, vddio):
-        return [map for map in CV18XX_VDDIO_MAP if map["type"] == type and map["VDDIO"] == vddio][0]
+        return [map for map in vddio_map if map["type"] == type and map["VDDIO"] == vddio][0]
     def get_vddio_schmit(value):
         return value[0][1] if len(value) == 6 else 0
-    def print_vddio_pull(fp, chipname, state, *value):
-        fp.write("""static int {0}_get_pull_{1}(const struct sophgo_pin *sp, const u32 *psmap)
+    def cook_func_head(storage, symbol):
+        head = "{0}int {1}(".format(storage, symbol)
+        tabs = int(len(head) / 8)
+        spaces = len(head) % 8
+        return head + "const struct sophgo_pin *sp, const u32 *psmap,\n" + "\t" * tabs + " " * spaces + "const u32 **map)"
+
+    def cook_vddio_pull(state, *value):
+        def render(storage, symbol, ref):
+            return """{0}int {1}(const struct sophgo_pin *sp, const u32 *psmap)
 {{
 	const struct cv1800_pin *pin = sophgo_to_cv1800_pin(sp);
 	u32 pstate = psmap[pin->power_domain];
@@ -197,136 +207,308 @@ def print_vddio(fp, chipname):
 
 	return -ENOTSUPP;
 }}
-""".format(chipname, state, *value))
-
-    def print_vddio_map(fp, chipname, mtype, name, value):
-        fp.write("static const u32 {0}_{1}_{2}_map[] = {{\n".format(chipname, name, mtype))
-        fp.write("\t" + ",\n\t".join(value) + "\n")
-        fp.write("};\n")
-
-    def print_vddio_oc_func(fp, chipname):
-        head = "static int {0}_get_oc_map(".format(chipname)
-        tabs = int(len(head) / 8)
-        spaces = len(head) % 8
-        fp.write(head + "const struct sophgo_pin *sp, const u32 *psmap,\n")
-        fp.write("\t" * tabs + " " * spaces + "const u32 **map)\n")
-        fp.write("""{{
+""".format(storage, symbol, *value)
+
+        def declare(symbol):
+            return "int {0}(const struct sophgo_pin *sp, const u32 *psmap);\n".format(symbol)
+
+        return {
+            "name": "get_pull_" + state,
+            "deps": [],
+            "size": None,
+            "render": render,
+            "declare": declare,
+        }
+
+    def cook_vddio_map(mtype, name, value):
+        def render(storage, symbol, ref):
+            return "{0}const u32 {1}[] = {{\n".format(storage, symbol) + \
+                "\t" + ",\n\t".join(value) + "\n" + \
+                "};\n"
+
+        def declare(symbol):
+            return "extern const u32 {0}[{1}];\n".format(symbol, len(value))
+
+        return {
+            "name": "{0}_{1}_map".format(name, mtype),
+            "deps": [],
+            "size": 4 * len(value),
+            "render": render,
+            "declare": declare,
+        }
+
+    def cook_vddio_oc_func():
+        def render(storage, symbol, ref):
+            return cook_func_head(storage, symbol) + """
+{{
 	const struct cv1800_pin *pin = sophgo_to_cv1800_pin(sp);
 	enum cv1800_pin_io_type type = cv1800_pin_io_type(pin);
 	u32 pstate = psmap[pin->power_domain];
 
 	if (type == IO_TYPE_1V8_ONLY) {{
-		*map = {0}_1v8_oc_map;
-		return ARRAY_SIZE({0}_1v8_oc_map);
+		*map = {0};
+		return ARRAY_SIZE({0});
 	}}
 
 	if (type == IO_TYPE_1V8_OR_3V3) {{
 		if (pstate == PIN_POWER_STATE_1V8) {{
-			*map = {0}_18od33_1v8_oc_map;
-			return ARRAY_SIZE({0}_18od33_1v8_oc_map);
+			*map = {1};
+			return ARRAY_SIZE({1});
 		}} else if (pstate == PIN_POWER_STATE_3V3) {{
-			*map = {0}_18od33_3v3_oc_map;
-			return ARRAY_SIZE({0}_18od33_3v3_oc_map);
+			*map = {2};
+			return ARRAY_SIZE({2});
 		}}
 	}}
 
 	if (type == IO_TYPE_ETH) {{
-		*map = {0}_eth_oc_map;
-		return ARRAY_SIZE({0}_eth_oc_map);
+		*map = {3};
+		return ARRAY_SIZE({3});
 	}}
 
 	return -ENOTSUPP;
 }}
-""".format(chipname))
-
-    def print_vddio_schmitt_func(fp, chipname):
-        head = "static int {0}_get_schmitt_map(".format(chipname)
-        tabs = int(len(head) / 8)
-        spaces = len(head) % 8
-        fp.write(head + "const struct sophgo_pin *sp, const u32 *psmap,\n")
-        fp.write("\t" * tabs + " " * spaces + "const u32 **map)\n")
-        fp.write("""{{
+""".format(*[ref[dep] for dep in deps])
+
+        def declare(symbol):
+            return cook_func_head("", symbol) + ";\n"
+
+        deps = ["1v8_oc_map", "18od33_1v8_oc_map", "18od33_3v3_oc_map", "eth_oc_map"]
+        return {
+            "name": "get_oc_map",
+            "deps": deps,
+            "size": None,
+            "render": render,
+            "declare": declare,
+        }
+
+    def cook_vddio_schmitt_func():
+        def render(storage, symbol, ref):
+            return cook_func_head(storage, symbol) + """
+{{
 	const struct cv1800_pin *pin = sophgo_to_cv1800_pin(sp);
 	enum cv1800_pin_io_type type = cv1800_pin_io_type(pin);
 	u32 pstate = psmap[pin->power_domain];
 
 	if (type == IO_TYPE_1V8_ONLY) {{
-		*map = {0}_1v8_schmitt_map;
-		return ARRAY_SIZE({0}_1v8_schmitt_map);
+		*map = {0};
+		return ARRAY_SIZE({0});
 	}}
 
 	if (type == IO_TYPE_1V8_OR_3V3) {{
 		if (pstate == PIN_POWER_STATE_1V8) {{
-			*map = {0}_18od33_1v8_schmitt_map;
-			return ARRAY_SIZE({0}_18od33_1v8_schmitt_map);
+			*map = {1};
+			return ARRAY_SIZE({1});
 		}} else if (pstate == PIN_POWER_STATE_3V3) {{
-			*map = {0}_18od33_3v3_schmitt_map;
-			return ARRAY_SIZE({0}_18od33_3v3_schmitt_map);
+			*map = {2};
+			return ARRAY_SIZE({2});
 		}}
 	}}
 
 	return -ENOTSUPP;
 }}
-""".format(chipname))
+""".format(*[ref[dep] for dep in deps])
+
+        def declare(symbol):
+            return cook_func_head("", symbol) + ";\n"
+
+        deps = ["1v8_schmitt_map", "18od33_1v8_schmitt_map", "18od33_3v3_schmitt_map"]
+        return {
+            "name": "get_schmitt_map",
+            "deps": deps,
+            "size": None,
+            "render": render,
+            "declare": declare,
+        }
+
+    return [
+        cook_vddio_pull("up",
+            get_vddio_map(PIN_IO_TYPE.IO_TYPE_1V8_ONLY, 1800)["map"]["pull-up"],
+            get_vddio_map(PIN_IO_TYPE.IO_TYPE_1V8_OR_3V3, 1800)["map"]["pull-up"],
+            get_vddio_map(PIN_IO_TYPE.IO_TYPE_1V8_OR_3V3, 3300)["map"]["pull-up"],
+        ),
+        cook_vddio_pull("down",
+            get_vddio_map(PIN_IO_TYPE.IO_TYPE_1V8_ONLY, 1800)["map"]["pull-down"],
+            get_vddio_map(PIN_IO_TYPE.IO_TYPE_1V8_OR_3V3, 1800)["map"]["pull-down"],
+            get_vddio_map(PIN_IO_TYPE.IO_TYPE_1V8_OR_3V3, 3300)["map"]["pull-down"],
+        ),
+        cook_vddio_map("oc", "1v8", [str(value[1]) for value in get_vddio_map(PIN_IO_TYPE.IO_TYPE_1V8_ONLY, 1800)["map"]["output-low"]]),
+        cook_vddio_map("oc", "18od33_1v8", [str(value[1]) for value in get_vddio_map(PIN_IO_TYPE.IO_TYPE_1V8_OR_3V3, 1800)["map"]["output-low"]]),
+        cook_vddio_map("oc", "18od33_3v3", [str(value[1]) for value in get_vddio_map(PIN_IO_TYPE.IO_TYPE_1V8_OR_3V3, 3300)["map"]["output-low"]]),
+        cook_vddio_map("oc", "eth", [str(value[1]) for value in get_vddio_map(PIN_IO_TYPE.IO_TYPE_ETH, 1800)["map"]["output-low"]]),
+        cook_vddio_oc_func(),
+        cook_vddio_map("schmitt", "1v8", [str(get_vddio_schmit(value) * 1000) for value in get_vddio_map(PIN_IO_TYPE.IO_TYPE_1V8_ONLY, 1800)["map"]["schmit-trigger"]]),
+        cook_vddio_map("schmitt", "18od33_1v8", [str(get_vddio_schmit(value) * 1000) for value in get_vddio_map(PIN_IO_TYPE.IO_TYPE_1V8_OR_3V3, 1800)["map"]["schmit-trigger"]]),
+        cook_vddio_map("schmitt", "18od33_3v3", [str(get_vddio_schmit(value) * 1000) for value in get_vddio_map(PIN_IO_TYPE.IO_TYPE_1V8_OR_3V3, 3300)["map"]["schmit-trigger"]]),
+        cook_vddio_schmitt_func(),
+    ]
 
-    print_vddio_pull(fp, chipname, "up",
-        get_vddio_map(PIN_IO_TYPE.IO_TYPE_1V8_ONLY, 1800)["map"]["pull-up"],
-        get_vddio_map(PIN_IO_TYPE.IO_TYPE_1V8_OR_3V3, 1800)["map"]["pull-up"],
-        get_vddio_map(PIN_IO_TYPE.IO_TYPE_1V8_OR_3V3, 3300)["map"]["pull-up"],
-    )
-    fp.write("\n")
+def print_vddio(fp, chipname: str, items: list[dict], shared: dict):
+    ref = {item["name"]: shared.get(item["name"], chipname + "_" + item["name"]) for item in items}
 
-    print_vddio_pull(fp, chipname, "down",
-        get_vddio_map(PIN_IO_TYPE.IO_TYPE_1V8_ONLY, 1800)["map"]["pull-down"],
-        get_vddio_map(PIN_IO_TYPE.IO_TYPE_1V8_OR_3V3, 1800)["map"]["pull-down"],
-        get_vddio_map(PIN_IO_TYPE.IO_TYPE_1V8_OR_3V3, 3300)["map"]["pull-down"],
-    )
-    fp.write("\n")
+    for item in items:
+        if item["name"] in shared:
+            continue
+        fp.write(item["render"]("static ", ref[item["name"]], ref))
+        fp.write("\n")
 
-    print_vddio_map(fp, chipname, "oc", "1v8", [str(value[1]) for value in get_vddio_map(PIN_IO_TYPE.IO_TYPE_1V8_ONLY, 1800)["map"]["output-low"]])
-    fp.write("\n")
-    print_vddio_map(fp, chipname, "oc", "18od33_1v8", [str(value[1]) for value in get_vddio_map(PIN_IO_TYPE.IO_TYPE_1V8_OR_3V3, 1800)["map"]["output-low"]])
-    fp.write("\n")
-    print_vddio_map(fp, chipname, "oc", "18od33_3v3", [str(value[1]) for value in get_vddio_map(PIN_IO_TYPE.IO_TYPE_1V8_OR_3V3, 3300)["map"]["output-low"]])
-    fp.write("\n")
-    print_vddio_map(fp, chipname, "oc", "eth", [str(value[1]) for value in get_vddio_map(PIN_IO_TYPE.IO_TYPE_ETH, 1800)["map"]["output-low"]])
-    fp.write("\n")
+    fp.write("""static const struct sophgo_vddio_cfg_ops {0}_vddio_cfg_ops = {{
+	.get_pull_up\t\t= {1},
+	.get_pull_down\t\t= {2},
+	.get_oc_map\t\t= {3},
+	.get_schmitt_map\t= {4},
+}};
+""".format(chipname, ref["get_pull_up"], ref["get_pull_down"], ref["get_oc_map"], ref["get_schmitt_map"]))
+
+def hash_vddio_items(items: list[dict]):
+    hashes = {}
+
+    # an item hashes its own text with every symbol masked, plus the
+    # hashes of the tables it references, so two functions only match
+    # when the tables behind them match as well
+    for item in items:
+        digest = hashlib.sha256(item["render"]("", "@", {dep: "@" + dep for dep in item["deps"]}).encode())
+        for dep in item["deps"]:
+            digest.update(hashes[dep].encode())
+        hashes[item["name"]] = digest.hexdigest()
+
+    return hashes
+
+def share_vddio_items(chip_items: dict[str, list[dict]]):
+    chip_hashes = {chipname: hash_vddio_items(items) for chipname, items in chip_items.items()}
+    chip_item_map = {chipname: {item["name"]: item for item in items} for chipname, items in chip_items.items()}
+    chip_shared = {chipname: {} for chipname in chip_items}
+    groups = []
+
+    for item in list(chip_items.values())[0]:
+        name = item["name"]
+        hashgroups = {}
+        for chipname in chip_items:
+            hashgroups.setdefault(chip_hashes[chipname][name], []).append(chipname)
+
+        candidates = [(digest, chips) for digest, chips in hashgroups.items() if len(chips) > 1]
+        for digest, chips in candidates:
+            symbol = SHARED_VDDIO_PREFIX + "_" + name
+            if len(candidates) > 1:
+                symbol = symbol + "_" + digest[:8]
+
+            for chipname in chips:
+                chip_shared[chipname][name] = symbol
+            groups.append((chip_item_map[chips[0]][name], symbol, chips))
+
+    return chip_shared, groups
+
+def print_shared_vddio_header(fp, chip_shared: dict, groups: list):
+    year = datetime.datetime.now().date().strftime("%Y")
+    guard = "_PINCTRL_SOPHGO_{}_H".format(SHARED_VDDIO_NAME.upper().replace("-", "_"))
 
-    print_vddio_oc_func(fp, chipname)
-    fp.write("\n")
+    fp.write("""/* SPDX-License-Identifier: GPL-2.0 */
+/*
+ * Copyright (C) {0} Inochi Amaoto <inochiama@outlook.com>
+ *
+ * This file is generated from vendor pinout definition.
+ */
+
+#ifndef {1}
+#define {1}
+
+#include <linux/types.h>
+
+struct sophgo_pin;
 
-    print_vddio_map(fp, chipname, "schmitt", "1v8", [str(get_vddio_schmit(value) * 1000) for value in get_vddio_map(PIN_IO_TYPE.IO_TYPE_1V8_ONLY, 1800)["map"]["schmit-trigger"]])
+""".format(year, guard))
+
+    for item, symbol, chips in groups:
+        fp.write(item["declare"](symbol))
+
+    fp.write("\n#endif /* {} */\n".format(guard))
+
+def print_shared_vddio(fp, chip_shared: dict, groups: list):
+    year = datetime.datetime.now().date().strftime("%Y")
+
+    fp.write("""// SPDX-License-Identifier: GPL-2.0
+/*
+ * Sophgo CV18XX SoC shared pinctrl vddio data.
+ *
+ * Copyright (C) {0} Inochi Amaoto <inochiama@outlook.com>
+ *
+ * This file is generated from vendor pinout definition.
+ */
+
+#include <linux/module.h>
+
+#include "pinctrl-cv18xx.h"
+#include "pinctrl-{1}.h"
+""".format(year, SHARED_VDDIO_NAME))
+
+    for item, symbol, chips in groups:
+        fp.write("\n")
+        fp.write("/* shared by {} */\n".format(", ".join(chips)))
+        fp.write(item["render"]("", symbol, chip_shared[chips[0]]))
+        fp.write("EXPORT_SYMBOL_GPL({});\n".format(symbol))
+
+    fp.write("""
+MODULE_DESCRIPTION("Shared pinctrl vddio data for the {} series SoC");
+MODULE_LICENSE("GPL");
+""".format(SHARED_VDDIO_PREFIX.upper()))
+
+def print_shared_vddio_report(fp, groups: list):
+    rodata = 0
+    source = 0
+    funcs = 0
+
+    for item, symbol, chips in groups:
+        copies = len(chips) - 1
+        text = item["render"]("static ", symbol, {dep: dep for dep in item["deps"]})
+        source += len(text) * copies
+        if item["size"] is not None:
+            rodata += item["size"] * copies
+            fp.write("{}: {} copies, {} bytes rodata saved\n".format(symbol, len(chips), item["size"] * copies))
+        else:
+            funcs += copies
+            fp.write("{}: {} copies, {} duplicate functions removed\n".format(symbol, len(chips), copies))
+
+    # only the tables have a known object size, the function bodies are
+    # reported as a count and as generated C source, which is not text size
+    fp.write("rodata saved: {} bytes\n".format(rodata))
+    fp.write("functions removed: {} (object size not measured)\n".format(funcs))
+    fp.write("generated C source saved: {} characters\n".format(source))
+
+def print_config(fp, chipname: str, pins: dict, table: dict, items: list[dict], shared: dict):
+    print_misc_top(fp, chipname, len(shared) > 0)
     fp.write("\n")
-    print_vddio_map(fp, chipname, "schmitt", "18od33_1v8", [str(get_vddio_schmit(value) * 1000) for value in get_vddio_map(PIN_IO_TYPE.IO_TYPE_1V8_OR_3V3, 1800)["map"]["schmit-trigger"]])
+    print_power_domain_mapping(fp, chipname, pins)
     fp.write("\n")
-    print_vddio_map(fp, chipname, "schmitt", "18od33_3v3", [str(get_vddio_schmit(value) * 1000) for value in get_vddio_map(PIN_IO_TYPE.IO_TYPE_1V8_OR_3V3, 3300)["map"]["schmit-trigger"]])
+    print_vddio(fp, chipname, items, shared)
     fp.write("\n")
-
-    print_vddio_schmitt_func(fp,chipname)
+    print_pins(fp, chipname, pins)
     fp.write("\n")
-    fp.write("""static const struct sophgo_vddio_cfg_ops {0}_vddio_cfg_ops = {{
-	.get_pull_up\t\t= {0}_get_pull_up,
-	.get_pull_down\t\t= {0}_get_pull_down,
-	.get_oc_map\t\t= {0}_get_oc_map,
-	.get_schmitt_map\t= {0}_get_schmitt_map,
-}};
-""".format(chipname))
+    print_pindata(fp, chipname, pins, table)
+    fp.write("\n")
+    print_misc_down(fp, chipname)
 
 
 if __name__ == "__main__":
-    chipname = sys.argv[1]
-    pins = pindef.parse_pins(chipname + "_pindef.csv")
+    if sys.argv[1] == "--shared":
+        chipnames = sys.argv[2:]
+    else:
+        chipnames = sys.argv[1:2]
 
-    with open("pinctrl-" + chipname + ".c", "w", encoding="utf-8") as fp:
-        print_misc_top(fp, chipname)
-        fp.write("\n")
-        print_power_domain_mapping(fp, chipname, pins)
-        fp.write("\n")
-        print_vddio(fp, chipname)
-        fp.write("\n")
-        print_pins(fp, chipname, pins)
-        fp.write("\n")
-        print_pindata(fp, chipname, pins)
-        fp.write("\n")
-        print_misc_down(fp, chipname)
+    chip_items = {chipname: cook_vddio_items(get_chip_vddio(chipname)) for chipname in chipnames}
+    chip_shared = {chipname: {} for chipname in chipnames}
+
+    if sys.argv[1] == "--shared":
+        chip_shared, groups = share_vddio_items(chip_items)
+
+        with open("pinctrl-" + SHARED_VDDIO_NAME + ".h", "w", encoding="utf-8") as fp:
+            print_shared_vddio_header(fp, chip_shared, groups)
+        with open("pinctrl-" + SHARED_VDDIO_NAME + ".c", "w", encoding="utf-8") as fp:
+            print_shared_vddio(fp, chip_shared, groups)
+
+        print_shared_vddio_report(sys.stdout, groups)
+
+    for chipname in chipnames:
+        table = pindef.region_table(get_chip_regions(chipname))
+        pins = pindef.parse_pins(chipname + "_pindef.csv", table)
 
+        with open("pinctrl-" + chipname + ".c", "w", encoding="utf-8") as fp:
+            print_config(fp, chipname, pins, table, chip_items[chipname], chip_shared[chipname])
@@ -1,9 +1,14 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import bisect
 import csv
+import os
 import re
+import threading
+from collections import OrderedDict
 from enum import Enum
+from region import CV18XX_REGION_MAP, CHIP_REGION_MAP, get_chip_regions
 
 FUNC_PATTERN = re.compile(r"(\d) *: *([^ ]+)")
 
@@ -66,19 +71,56 @@ def parse_pin_mux(row):
         "func": {int(iter.group(1)): iter.group(2) for iter in FUNC_PATTERN.finditer(row['Description'].replace('\n', ' '))},
     }
     mux['max'] = max(mux['func'].keys())
-    mux['area'], mux['offset'] = pin_addr_area(addr)
 
     return mux
 
-def pin_addr_area(value: int):
-    if value >= 0x03001000 and value < 0x03002000:
-        return "SYS", value - 0x03001000
-    elif value >= 0x05027000 and value < 0x05028000:
-        return "RTC", value - 0x05027000
-    else:
+def region_table(regions: list[dict]) -> dict:
+    regions = sorted(regions, key=lambda region: region["base"])
+
+    for prev, cur in zip(regions, regions[1:]):
+        if prev["base"] + prev["size"] > cur["base"]:
+            raise KeyError((prev["name"], cur["name"]))
+
+    return {
+        "bases": [region["base"] for region in regions],
+        "regions": regions,
+        "names": {region["name"]: region for region in regions},
+    }
+
+DEFAULT_REGION_TABLE = region_table(CV18XX_REGION_MAP)
+
+def region_match(table: dict, pos: int, value: int):
+    if pos < 0:
+        raise KeyError(hex(value))
+
+    region = table["regions"][pos]
+    if value >= region["base"] + region["size"]:
         raise KeyError(hex(value))
 
-def parse_pins(filename: str) -> dict[int, dict]:
+    return region["name"], value - region["base"]
+
+def pin_addr_area(value: int, table: dict = DEFAULT_REGION_TABLE):
+    return region_match(table, bisect.bisect_right(table["bases"], value) - 1, value)
+
+def pin_addr_areas(values: list[int], table: dict = DEFAULT_REGION_TABLE):
+    bases = table["bases"]
+    result = [None] * len(values)
+    pos = -1
+
+    # walk the sorted addresses and the sorted bases together, so the
+    # cost per address does not grow with the number of regions
+    for idx in sorted(range(len(values)), key=values.__getitem__):
+        value = values[idx]
+        while pos + 1 < len(bases) and bases[pos + 1] <= value:
+            pos += 1
+        result[idx] = region_match(table, pos, value)
+
+    return result
+
+def pin_area_enum(area: str, table: dict = DEFAULT_REGION_TABLE):
+    return table["names"][area]["enum"]
+
+def parse_pins(filename: str, table: dict = DEFAULT_REGION_TABLE) -> dict[int, dict]:
     NArows = []
     pins = {}
 
@@ -102,7 +144,6 @@ def parse_pins(filename: str) -> dict[int, dict]:
                     "name": name,
                     "address": addr,
                 }
-                pin['iocfg']['area'], pin['iocfg']['offset'] = pin_addr_area(addr)
 
             pin['mux'] = parse_pin_mux(row)
 
@@ -121,8 +162,101 @@ def parse_pins(filename: str) -> dict[int, dict]:
 
         pins[key]['mux']['sub'] = parse_pin_mux(row)
 
+    regs = []
+    for pin in pins.values():
+        if 'iocfg' in pin:
+            regs.append(pin['iocfg'])
+        regs.append(pin['mux'])
+        if 'sub' in pin['mux']:
+            regs.append(pin['mux']['sub'])
+
+    for reg, (area, offset) in zip(regs, pin_addr_areas([reg['address'] for reg in regs], table)):
+        reg['area'], reg['offset'] = area, offset
+
     return {k: v for k, v in sorted(pins.items())}
 
+class ChipRegistry:
+    """bounded LRU of parsed chips, safe to share between threads
+
+    Chips are cached by the real path of their pindef file, so symlinked
+    aliases share one parse. The returned pins are shared by all callers
+    and must be copied before being modified.
+    """
+
+    def __init__(self, maxsize: int = 8, path: str = os.path.dirname(os.path.abspath(__file__))):
+        self.maxsize = maxsize
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._chips = OrderedDict()
+        self._loading = {}
+        self._lock = threading.Lock()
+
+    def _lookup(self, key: str):
+        pins = self._chips.get(key)
+        if pins is not None:
+            self._chips.move_to_end(key)
+        return pins
+
+    def get_chip(self, name: str) -> dict[int, dict]:
+        if name not in CHIP_REGION_MAP:
+            raise KeyError(name)
+
+        key = os.path.realpath(os.path.join(self.path, name + "_pindef.csv"))
+
+        with self._lock:
+            pins = self._lookup(key)
+            if pins is not None:
+                self.hits += 1
+                return pins
+
+            self.misses += 1
+            loading = self._loading.setdefault(key, threading.Lock())
+
+        # only one thread parses a chip, the others wait for its result
+        try:
+            with loading:
+                with self._lock:
+                    pins = self._lookup(key)
+                if pins is not None:
+                    return pins
+
+                pins = parse_pins(key, region_table(get_chip_regions(name)))
+
+                with self._lock:
+                    self._chips[key] = pins
+                    while len(self._chips) > self.maxsize:
+                        self._chips.popitem(last=False)
+                        self.evictions += 1
+        finally:
+            with self._lock:
+                if self._loading.get(key) is loading:
+                    del self._loading[key]
+
+        return pins
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._chips),
+            }
+
+    def clear(self):
+        with self._lock:
+            self._chips.clear()
+
+CHIP_REGISTRY = ChipRegistry()
+
+def get_chip(name: str) -> dict[int, dict]:
+    return CHIP_REGISTRY.get_chip(name)
+
+def chip_stats() -> dict:
+    return CHIP_REGISTRY.stats()
+
 if __name__ == "__main__":
     import sys
     import pprint
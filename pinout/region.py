@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+CV18XX_REGION_MAP = [
+    {
+        "name": "SYS",
+        "base": 0x03001000,
+        "size": 0x1000,
+        "enum": "CV1800_PINCONF_AREA_SYS",
+    },
+    {
+        "name": "RTC",
+        "base": 0x05027000,
+        "size": 0x1000,
+        "enum": "CV1800_PINCONF_AREA_RTC",
+    },
+]
+
+CHIP_REGION_MAP = {
+    "cv1800b": CV18XX_REGION_MAP,
+    "cv1812h": CV18XX_REGION_MAP,
+    "sg2000": CV18XX_REGION_MAP,
+    "sg2002": CV18XX_REGION_MAP,
+}
+
+def get_chip_regions(chipname: str):
+    return CHIP_REGION_MAP.get(chipname, CV18XX_REGION_MAP)
@@ -167,4 +167,12 @@ CV18XX_VDDIO_MAP = [
     },
 ]
 
+CHIP_VDDIO_MAP = {
+    "cv1800b": CV18XX_VDDIO_MAP,
+    "cv1812h": CV18XX_VDDIO_MAP,
+    "sg2000": CV18XX_VDDIO_MAP,
+    "sg2002": CV18XX_VDDIO_MAP,
+}
 
+def get_chip_vddio(chipname: str):
+    return CHIP_VDDIO_MAP.get(chipname, CV18XX_VDDIO_MAP)